@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 import dash_bootstrap_components as dbc
 import dash_uploader as du
@@ -7,489 +8,420 @@ from dash import dash_table, dcc, html
 DEFAULT_TILED_URI = os.getenv("DEFAULT_TILED_URI", "")
 DEFAULT_TILED_SUB_URI = os.getenv("DEFAULT_TILED_SUB_URI", "")
 
+# Built file explorers, keyed by (max_file_size, upload_folder_root is None)
+_LAYOUT_CACHE = {}
+
+# Pattern-matching ids of the file explorer components, keyed by name
+_IDS = {}
+
+# Size of the chunks sent by the file uploader, in MB
+_UPLOAD_CHUNK_SIZE = 8
+
+# Static styles and options, shared by every file explorer layout
+_HIDDEN_STYLE = {"display": "None"}
+_UPLOAD_STYLE = {
+    "textAlign": "center",
+    "width": "100%",
+    "padding": "5px",
+    "display": "inline-block",
+    "margin-bottom": "10px",
+    "margin-right": "20px",
+}
+_LABEL_STYLE = {"margin-right": "10px", "margin-bottom": "10px"}
+_SELECT_BTN_STYLE = {"margin-top": "10px", "width": "100%"}
+_ACTION_BTN_STYLE = {"width": "40%", "margin-top": "10px"}
+_DROPDOWN_STYLE = {"height": "2.5rem", "width": "100%"}
+_FORMAT_LABEL_STYLE = {"height": "2.5rem", "width": "100%"}
+_BROWSE_LABEL_STYLE = {"height": "2.5rem", "margin-bottom": "10px", "width": "100%"}
+
+_BROWSE_FORMAT_OPTIONS = [
+    {"label": "dir", "value": "**/"},
+    {"label": "all (*)", "value": "*"},
+    {"label": ".png", "value": "**/*.png"},
+    {"label": ".jpg/jpeg", "value": "**/*.jpg"},
+    {"label": ".tif/tiff", "value": "**/*.tif"},
+    {"label": ".txt", "value": "**/*.txt"},
+    {"label": ".csv", "value": "**/*.csv"},
+]
+# Directories can be browsed but not imported
+_IMPORT_FORMAT_OPTIONS = _BROWSE_FORMAT_OPTIONS[1:]
+
+# Common arguments of the files and tiled tables, which are virtualized so that only the
+# visible rows are rendered in the browser
+_TABLE_KWARGS = dict(
+    columns=[{"name": "URI", "id": "uri"}],
+    page_action="none",
+    virtualization=True,
+    row_selectable="multi",
+    style_cell={"padding": "0.5rem", "textAlign": "left"},
+    fixed_rows={"headers": True},
+    style_table={"height": "300px", "overflowY": "auto"},
+)
+
+
+def _id(name):
+    """
+    Get the pattern-matching id of a file explorer component, which is created once per name
+    Args:
+        name:               Name of the component
+    Returns:
+        Dictionary with the id of the component
+    """
+    component_id = _IDS.get(name)
+    if component_id is None:
+        component_id = _IDS[name] = {"base_id": "file-manager", "name": name}
+    return component_id
+
 
 def create_file_explorer(max_file_size, upload_folder_root=None):
     """
-    Creates the dash components for the file explorer
+    Creates the dash components for the file explorer. The layout only depends on the maximum
+    file size and on whether an upload folder has been set, so it is built once per combination
+    and reused across calls
     Args:
         max_file_size:      Maximum file size to be uploaded
-        default_tiled_uri:  Default Tiled URI to be displayed in file manager
+        upload_folder_root: Root folder to upload directory, hides the uploader when None
+    Returns:
+        file_explorer:      HTML.DIV with all the corresponding components of the file explorer
+    """
+    key = (max_file_size, upload_folder_root is None)
+    file_explorer = _LAYOUT_CACHE.get(key)
+    if file_explorer is None:
+        file_explorer = _LAYOUT_CACHE[key] = _build_file_explorer(
+            max_file_size, upload_folder_root is not None
+        )
+    return file_explorer
+
+
+def _build_file_explorer(max_file_size, show_upload):
+    """
+    Builds the dash components for the file explorer. Only the filesystem tab depends on the
+    arguments, the remaining sections are built once and shared across layouts
+    Args:
+        max_file_size:      Maximum file size to be uploaded
+        show_upload:        Display the file uploader
     Returns:
         file_explorer:      HTML.DIV with all the corresponding components of the file explorer
     """
-    if upload_folder_root is None:
-        upload_style = {"display": "None"}
-    else:
-        upload_style = {
-            "textAlign": "center",
-            "width": "100%",
-            "padding": "5px",
-            "display": "inline-block",
-            "margin-bottom": "10px",
-            "margin-right": "20px",
-        }
     file_explorer = html.Div(
         [
             dbc.Card(
                 [
                     dbc.CardBody(
-                        id={"base_id": "file-manager", "name": "data-body"},
+                        id=_id("data-body"),
                         children=[
                             dcc.Tabs(
-                                id={"base_id": "file-manager", "name": "tabs"},
+                                id=_id("tabs"),
                                 value="file",
                                 children=[
-                                    dcc.Tab(
-                                        label="Filesystem",
-                                        value="file",
-                                        children=[
-                                            # UPLOADING DATA
-                                            html.P(),
-                                            html.Div(
-                                                [
-                                                    dbc.Label(
-                                                        "Upload a new file or a zipped folder:",
-                                                        style={
-                                                            "margin-right": "10px",
-                                                            "margin-bottom": "10px",
-                                                        },
-                                                    ),
-                                                    du.Upload(
-                                                        id={
-                                                            "base_id": "file-manager",
-                                                            "name": "dash-uploader",
-                                                        },
-                                                        max_file_size=max_file_size,
-                                                        cancel_button=True,
-                                                        pause_button=True,
-                                                        default_style={
-                                                            "minHeight": 1,
-                                                            "lineHeight": 1,
-                                                        },
-                                                    ),
-                                                ],
-                                                style=upload_style,
-                                            ),
-                                            # FILE TABLE
-                                            dbc.Row(
-                                                [
-                                                    dbc.Col(
-                                                        [
-                                                            dbc.Button(
-                                                                "Select all",
-                                                                id={
-                                                                    "base_id": "file-manager",
-                                                                    "name": "select-all-files",
-                                                                },
-                                                                n_clicks=0,
-                                                                color="primary",
-                                                                outline=True,
-                                                                style={
-                                                                    "margin-top": "10px",
-                                                                    "width": "100%",
-                                                                },
-                                                            ),
-                                                        ],
-                                                        width=3,
-                                                    ),
-                                                    dbc.Col(
-                                                        [
-                                                            dbc.Button(
-                                                                "Unselect all",
-                                                                id={
-                                                                    "base_id": "file-manager",
-                                                                    "name": "unselect-all-files",
-                                                                },
-                                                                n_clicks=0,
-                                                                color="danger",
-                                                                outline=True,
-                                                                style={
-                                                                    "margin-top": "10px",
-                                                                    "width": "100%",
-                                                                },
-                                                            ),
-                                                        ],
-                                                        width=3,
-                                                    ),
-                                                ],
-                                                className="g-0",
-                                            ),
-                                            dbc.Row(
-                                                children=[
-                                                    dash_table.DataTable(
-                                                        id={
-                                                            "base_id": "file-manager",
-                                                            "name": "files-table",
-                                                        },
-                                                        columns=[
-                                                            {
-                                                                "name": "URI",
-                                                                "id": "uri",
-                                                            },
-                                                        ],
-                                                        data=[],
-                                                        page_size=5,
-                                                        hidden_columns=["type"],
-                                                        row_selectable="multi",
-                                                        style_cell={
-                                                            "padding": "0.5rem",
-                                                            "textAlign": "left",
-                                                        },
-                                                        fixed_rows={"headers": False},
-                                                        css=[
-                                                            {
-                                                                "selector": ".show-hide",
-                                                                "rule": "display: none",
-                                                            }
-                                                        ],
-                                                        style_data_conditional=[
-                                                            {
-                                                                "if": {
-                                                                    "filter_query": "{file_type} = dir"
-                                                                },
-                                                                "color": "blue",
-                                                            },
-                                                        ],
-                                                        style_table={
-                                                            "overflowY": "auto",
-                                                        },
-                                                    ),
-                                                ]
-                                            ),
-                                        ],
-                                    ),
-                                    dcc.Tab(
-                                        label="Tiled",
-                                        value="tiled",
-                                        children=[
-                                            # TILED FOR DATA ACCESS
-                                            html.P(),
-                                            dbc.Label(
-                                                "Load data through Tiled:",
-                                                style={
-                                                    "margin-right": "10px",
-                                                    "margin-bottom": "10px",
-                                                },
-                                            ),
-                                            dbc.Row(
-                                                [
-                                                    dbc.Col(
-                                                        dbc.InputGroup(
-                                                            [
-                                                                dbc.InputGroupText(
-                                                                    "URI"
-                                                                ),
-                                                                dbc.Textarea(
-                                                                    placeholder=DEFAULT_TILED_URI,
-                                                                    value=DEFAULT_TILED_URI,
-                                                                    style={
-                                                                        "height": "12px",
-                                                                    },
-                                                                    id={
-                                                                        "base_id": "file-manager",
-                                                                        "name": "tiled-uri",
-                                                                    },
-                                                                ),
-                                                            ]
-                                                        ),
-                                                        width=6,
-                                                    ),
-                                                    dbc.Col(
-                                                        dbc.InputGroup(
-                                                            [
-                                                                dbc.InputGroupText(
-                                                                    "Sub URI"
-                                                                ),
-                                                                dbc.Textarea(
-                                                                    placeholder=DEFAULT_TILED_SUB_URI,
-                                                                    value=DEFAULT_TILED_SUB_URI,
-                                                                    style={
-                                                                        "height": "12px",
-                                                                    },
-                                                                    id={
-                                                                        "base_id": "file-manager",
-                                                                        "name": "tiled-sub-uri",
-                                                                    },
-                                                                ),
-                                                            ]
-                                                        ),
-                                                        width=6,
-                                                    ),
-                                                ]
-                                            ),
-                                            dbc.Row(
-                                                [
-                                                    dbc.Button(
-                                                        "Browse Tiled",
-                                                        id={
-                                                            "base_id": "file-manager",
-                                                            "name": "tiled-browse",
-                                                        },
-                                                        color="primary",
-                                                        outline=True,
-                                                        n_clicks=0,
-                                                        style={
-                                                            "width": "40%",
-                                                            "margin-top": "10px",
-                                                        },
-                                                    )
-                                                ],
-                                                justify="center",
-                                            ),
-                                            # TILED TABLE
-                                            dbc.Row(
-                                                [
-                                                    dbc.Col(
-                                                        [
-                                                            dbc.Button(
-                                                                "Select all",
-                                                                id={
-                                                                    "base_id": "file-manager",
-                                                                    "name": "select-all-tiled",
-                                                                },
-                                                                n_clicks=0,
-                                                                color="primary",
-                                                                outline=True,
-                                                                style={
-                                                                    "margin-top": "10px",
-                                                                    "width": "100%",
-                                                                },
-                                                            ),
-                                                        ],
-                                                        width=3,
-                                                    ),
-                                                    dbc.Col(
-                                                        [
-                                                            dbc.Button(
-                                                                "Unselect all",
-                                                                id={
-                                                                    "base_id": "file-manager",
-                                                                    "name": "unselect-all-tiled",
-                                                                },
-                                                                n_clicks=0,
-                                                                color="danger",
-                                                                outline=True,
-                                                                style={
-                                                                    "margin-top": "10px",
-                                                                    "width": "100%",
-                                                                },
-                                                            ),
-                                                        ],
-                                                        width=3,
-                                                    ),
-                                                ],
-                                                className="g-0",
-                                            ),
-                                            dbc.Row(
-                                                children=[
-                                                    dash_table.DataTable(
-                                                        id={
-                                                            "base_id": "file-manager",
-                                                            "name": "tiled-table",
-                                                        },
-                                                        columns=[
-                                                            {
-                                                                "name": "URI",
-                                                                "id": "uri",
-                                                            },
-                                                        ],
-                                                        data=[],
-                                                        page_size=5,
-                                                        hidden_columns=["type"],
-                                                        row_selectable="multi",
-                                                        style_cell={
-                                                            "padding": "0.5rem",
-                                                            "textAlign": "left",
-                                                        },
-                                                        fixed_rows={"headers": False},
-                                                        css=[
-                                                            {
-                                                                "selector": ".show-hide",
-                                                                "rule": "display: none",
-                                                            }
-                                                        ],
-                                                        style_table={
-                                                            "overflowY": "auto",
-                                                        },
-                                                    ),
-                                                ]
-                                            ),
-                                        ],
-                                    ),
-                                ],
-                            ),
-                            # BROWSE/IMPORT DATA FORMATS
-                            dbc.Label(
-                                "Choose file formats:",
-                                className="mr-2",
-                                style={"display": "None"},
-                            ),
-                            dbc.Row(
-                                [
-                                    dbc.Col(
-                                        dbc.Row(
-                                            [
-                                                dbc.Col(
-                                                    dbc.InputGroupText(
-                                                        "Browse: ",
-                                                        style={
-                                                            "height": "2.5rem",
-                                                            "margin-bottom": "10px",
-                                                            "width": "100%",
-                                                        },
-                                                    ),
-                                                    width=5,
-                                                ),
-                                                dbc.Col(
-                                                    dcc.Dropdown(
-                                                        id={
-                                                            "base_id": "file-manager",
-                                                            "name": "browse-format",
-                                                        },
-                                                        options=[
-                                                            {
-                                                                "label": "dir",
-                                                                "value": "**/",
-                                                            },
-                                                            {
-                                                                "label": "all (*)",
-                                                                "value": "*",
-                                                            },
-                                                            {
-                                                                "label": ".png",
-                                                                "value": "**/*.png",
-                                                            },
-                                                            {
-                                                                "label": ".jpg/jpeg",
-                                                                "value": "**/*.jpg",
-                                                            },
-                                                            {
-                                                                "label": ".tif/tiff",
-                                                                "value": "**/*.tif",
-                                                            },
-                                                            {
-                                                                "label": ".txt",
-                                                                "value": "**/*.txt",
-                                                            },
-                                                            {
-                                                                "label": ".csv",
-                                                                "value": "**/*.csv",
-                                                            },
-                                                        ],
-                                                        value="**/",
-                                                        style={
-                                                            "height": "2.5rem",
-                                                            "width": "100%",
-                                                        },
-                                                    ),
-                                                    width=7,
-                                                ),
-                                            ],
-                                            className="g-0",
-                                        ),
-                                        width=5,
-                                    ),
-                                    dbc.Col(
-                                        dbc.Row(
-                                            [
-                                                dbc.Col(
-                                                    dbc.InputGroupText(
-                                                        "Import: ",
-                                                        style={
-                                                            "height": "2.5rem",
-                                                            "width": "100%",
-                                                        },
-                                                    ),
-                                                    width=5,
-                                                ),
-                                                dbc.Col(
-                                                    dcc.Dropdown(
-                                                        id={
-                                                            "base_id": "file-manager",
-                                                            "name": "import-format",
-                                                        },
-                                                        options=[
-                                                            {
-                                                                "label": "all (*)",
-                                                                "value": "*",
-                                                            },
-                                                            {
-                                                                "label": ".png",
-                                                                "value": "**/*.png",
-                                                            },
-                                                            {
-                                                                "label": ".jpg/jpeg",
-                                                                "value": "**/*.jpg",
-                                                            },
-                                                            {
-                                                                "label": ".tif/tiff",
-                                                                "value": "**/*.tif",
-                                                            },
-                                                            {
-                                                                "label": ".txt",
-                                                                "value": "**/*.txt",
-                                                            },
-                                                            {
-                                                                "label": ".csv",
-                                                                "value": "**/*.csv",
-                                                            },
-                                                        ],
-                                                        value="*",
-                                                        style={
-                                                            "height": "2.5rem",
-                                                            "width": "100%",
-                                                        },
-                                                    ),
-                                                    width=7,
-                                                ),
-                                            ],
-                                            className="g-0",
-                                        ),
-                                        width=5,
-                                    ),
+                                    _build_files_tab(max_file_size, show_upload),
+                                    _build_tiled_tab(),
                                 ],
-                                className="g-2",
-                                style={"display": "None"},
-                            ),
-                            # IMPORT BUTTON
-                            dbc.Row(
-                                dbc.Button(
-                                    "Import",
-                                    id={
-                                        "base_id": "file-manager",
-                                        "name": "import-dir",
-                                    },
-                                    color="primary",
-                                    n_clicks=0,
-                                    style={"width": "40%", "margin-top": "10px"},
-                                ),
-                                justify="center",
                             ),
+                            *_build_format_selection(),
+                            _build_import_button(),
                         ],
                     ),
-                    # CACHE
-                    dcc.Store(
-                        id={"base_id": "file-manager", "name": "data-project-dict"},
-                        data={},
+                    *_build_stores(),
+                ]
+            ),
+        ]
+    )
+    return file_explorer
+
+
+def _build_files_tab(max_file_size, show_upload):
+    """
+    Builds the filesystem tab with the file uploader and the table of files
+    Args:
+        max_file_size:      Maximum file size to be uploaded
+        show_upload:        Display the file uploader
+    Returns:
+        files_tab:          DCC.TAB for data access through the filesystem
+    """
+    upload_style = _UPLOAD_STYLE if show_upload else _HIDDEN_STYLE
+    files_tab = dcc.Tab(
+        label="Filesystem",
+        value="file",
+        children=[
+            # UPLOADING DATA
+            html.P(),
+            html.Div(
+                [
+                    dbc.Label(
+                        "Upload a new file or a zipped folder:",
+                        style=_LABEL_STYLE,
                     ),
-                    dcc.Store(
-                        id={"base_id": "file-manager", "name": "confirm-update-data"},
-                        data=True,
+                    du.Upload(
+                        id=_id("dash-uploader"),
+                        max_file_size=max_file_size,
+                        chunk_size=_UPLOAD_CHUNK_SIZE,
+                        max_files=1,
+                        cancel_button=True,
+                        pause_button=True,
+                        default_style={
+                            "minHeight": 1,
+                            "lineHeight": 1,
+                        },
                     ),
-                    dcc.Store(
-                        id={"base_id": "file-manager", "name": "confirm-clear-data"},
-                        data=False,
+                ],
+                style=upload_style,
+            ),
+            # FILE TABLE
+            _build_selection_buttons("files"),
+            dbc.Row(
+                children=[
+                    dash_table.DataTable(
+                        id=_id("files-table"),
+                        data=[],
+                        **_TABLE_KWARGS,
                     ),
-                    dcc.Store(
-                        id={"base_id": "file-manager", "name": "upload-data"},
-                        data=False,
+                ]
+            ),
+        ],
+    )
+    return files_tab
+
+
+def _build_selection_buttons(table_suffix):
+    """
+    Builds the select all and unselect all buttons of a table
+    Args:
+        table_suffix:       Suffix of the table ids, "files" or "tiled"
+    Returns:
+        selection_buttons:  DBC.ROW with the selection buttons
+    """
+    selection_buttons = dbc.Row(
+        [
+            dbc.Col(
+                [
+                    dbc.Button(
+                        label,
+                        id=_id(f"{action}-{table_suffix}"),
+                        n_clicks=0,
+                        color=color,
+                        outline=True,
+                        style=_SELECT_BTN_STYLE,
                     ),
-                    dcc.Store(
-                        id={"base_id": "file-manager", "name": "total-num-data-points"},
-                        data=0,
+                ],
+                width=3,
+            )
+            for label, action, color in (
+                ("Select all", "select-all", "primary"),
+                ("Unselect all", "unselect-all", "danger"),
+            )
+        ],
+        className="g-0",
+    )
+    return selection_buttons
+
+
+@lru_cache(maxsize=None)
+def _build_tiled_tab():
+    """
+    Builds the tiled tab with the tiled URI inputs and the table of tiled nodes
+    Returns:
+        tiled_tab:          DCC.TAB for data access through Tiled
+    """
+    tiled_tab = dcc.Tab(
+        label="Tiled",
+        value="tiled",
+        children=[
+            # TILED FOR DATA ACCESS
+            html.P(),
+            dbc.Label(
+                "Load data through Tiled:",
+                style=_LABEL_STYLE,
+            ),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.InputGroup(
+                            [
+                                dbc.InputGroupText("URI"),
+                                dbc.Input(
+                                    type="text",
+                                    debounce=True,
+                                    placeholder=DEFAULT_TILED_URI,
+                                    value=DEFAULT_TILED_URI,
+                                    id=_id("tiled-uri"),
+                                ),
+                            ]
+                        ),
+                        width=6,
+                    ),
+                    dbc.Col(
+                        dbc.InputGroup(
+                            [
+                                dbc.InputGroupText("Sub URI"),
+                                dbc.Input(
+                                    type="text",
+                                    debounce=True,
+                                    placeholder=DEFAULT_TILED_SUB_URI,
+                                    value=DEFAULT_TILED_SUB_URI,
+                                    id=_id("tiled-sub-uri"),
+                                ),
+                            ]
+                        ),
+                        width=6,
                     ),
                 ]
             ),
-        ]
+            dbc.Row(
+                [
+                    dbc.Button(
+                        "Browse Tiled",
+                        id=_id("tiled-browse"),
+                        color="primary",
+                        outline=True,
+                        n_clicks=0,
+                        style=_ACTION_BTN_STYLE,
+                    )
+                ],
+                justify="center",
+            ),
+            # TILED TABLE
+            _build_selection_buttons("tiled"),
+            dbc.Row(
+                children=[
+                    dash_table.DataTable(
+                        id=_id("tiled-table"),
+                        data=[],
+                        **_TABLE_KWARGS,
+                    ),
+                ]
+            ),
+        ],
     )
-    return file_explorer
+    return tiled_tab
+
+
+@lru_cache(maxsize=None)
+def _build_format_selection():
+    """
+    Builds the (hidden) browse and import file format selection
+    Returns:
+        format_selection:   Tuple of components for the file format selection
+    """
+    format_selection = (
+        dbc.Label(
+            "Choose file formats:",
+            className="mr-2",
+            style=_HIDDEN_STYLE,
+        ),
+        dbc.Row(
+            [
+                dbc.Col(
+                    dbc.Row(
+                        [
+                            dbc.Col(
+                                dbc.InputGroupText(
+                                    "Browse: ",
+                                    style=_BROWSE_LABEL_STYLE,
+                                ),
+                                width=5,
+                            ),
+                            dbc.Col(
+                                dcc.Dropdown(
+                                    id=_id("browse-format"),
+                                    options=_BROWSE_FORMAT_OPTIONS,
+                                    value="**/",
+                                    style=_DROPDOWN_STYLE,
+                                ),
+                                width=7,
+                            ),
+                        ],
+                        className="g-0",
+                    ),
+                    width=5,
+                ),
+                dbc.Col(
+                    dbc.Row(
+                        [
+                            dbc.Col(
+                                dbc.InputGroupText(
+                                    "Import: ",
+                                    style=_FORMAT_LABEL_STYLE,
+                                ),
+                                width=5,
+                            ),
+                            dbc.Col(
+                                dcc.Dropdown(
+                                    id=_id("import-format"),
+                                    options=_IMPORT_FORMAT_OPTIONS,
+                                    value="*",
+                                    style=_DROPDOWN_STYLE,
+                                ),
+                                width=7,
+                            ),
+                        ],
+                        className="g-0",
+                    ),
+                    width=5,
+                ),
+            ],
+            className="g-2",
+            style=_HIDDEN_STYLE,
+        ),
+    )
+    return format_selection
+
+
+@lru_cache(maxsize=None)
+def _build_import_button():
+    """
+    Builds the import button
+    Returns:
+        import_button:      DBC.ROW with the import button
+    """
+    import_button = dbc.Row(
+        dbc.Button(
+            "Import",
+            id=_id("import-dir"),
+            color="primary",
+            n_clicks=0,
+            style=_ACTION_BTN_STYLE,
+        ),
+        justify="center",
+    )
+    return import_button
+
+
+@lru_cache(maxsize=None)
+def _build_stores():
+    """
+    Builds the stores that cache the state of the file explorer
+    Returns:
+        stores:             Tuple of DCC.STORE components
+    """
+    stores = (
+        dcc.Store(
+            id=_id("data-project-dict"),
+            data={},
+        ),
+        dcc.Store(
+            id=_id("confirm-update-data"),
+            data=True,
+        ),
+        dcc.Store(
+            id=_id("confirm-clear-data"),
+            data=False,
+        ),
+        dcc.Store(
+            id=_id("upload-data"),
+            data=False,
+        ),
+        dcc.Store(
+            id=_id("total-num-data-points"),
+            data=0,
+        ),
+        dcc.Store(
+            id=_id("tiled-browse-request"),
+            data=None,
+        ),
+        dcc.Store(
+            id=_id("tiled-browsed-uri"),
+            data=None,
+        ),
+    )
+    return stores
@@ -129,16 +129,13 @@ class DataProject:
             for dataset_index, image_indices in dataset_indices.items()
         ]
 
+        read_dataset = partial(self.read_dataset, just_uri=just_uri)
         with ThreadPoolExecutor() as executor:
             try:
                 if just_uri:
-                    uris = list(
-                        executor.map(self.read_dataset, tasks, [just_uri] * len(tasks))
-                    )
+                    uris = list(executor.map(read_dataset, tasks))
                 else:
-                    results = list(
-                        executor.map(self.read_dataset, tasks, [just_uri] * len(tasks))
-                    )
+                    results = list(executor.map(read_dataset, tasks))
                     images, uris = map(list, zip(*results))
                     images = list(chain.from_iterable(images))
                 uris = list(chain.from_iterable(uris))
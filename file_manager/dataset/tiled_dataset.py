@@ -1,13 +1,21 @@
+import atexit
 import base64
+import collections
 import concurrent.futures
+import hashlib
 import io
+import itertools
 import os
-from functools import partial
+import tempfile
+import threading
+from functools import lru_cache, partial
 
+import diskcache
 import numpy as np
-from PIL import Image
+from PIL import Image, features
 from tiled.client import from_uri
 from tiled.client.array import ArrayClient
+from tiled.client.utils import handle_error
 
 from file_manager.dataset.dataset import Dataset
 
@@ -19,6 +27,136 @@ if STATIC_TILED_URI:
 else:
     STATIC_TILED_CLIENT = None
 
+# Browsed tiled nodes are cached on disk for TILED_BROWSE_CACHE_TTL seconds (60 by default), such
+# that the cache is shared with the processes that run the long callbacks. The cache is opened on
+# the first tiled browse, by default in a directory of the temporary folder that is private to the
+# current user (the temporary folder is already per user on Windows)
+TILED_BROWSE_CACHE_TTL = int(os.getenv("TILED_BROWSE_CACHE_TTL", "60"))
+_DEFAULT_BROWSE_CACHE_DIR = os.path.join(
+    tempfile.gettempdir(),
+    (
+        f"mlex_file_manager_tiled_browse_{os.getuid()}"
+        if hasattr(os, "getuid")
+        else "mlex_file_manager_tiled_browse"
+    ),
+)
+TILED_BROWSE_CACHE_DIR = os.getenv("TILED_BROWSE_CACHE_DIR", _DEFAULT_BROWSE_CACHE_DIR)
+_BROWSE_CACHE = None
+_BROWSE_CACHE_LOCK = threading.Lock()
+
+# Step used to downsample the images along each spatial dimension
+_DOWNSAMPLE = slice(None, None, 10)
+
+# Size of the thumbnails returned by read_data when resize is set
+_THUMBNAIL_SIZE = (200, 200)
+
+# PIL format and save options of the base64 thumbnails, keyed by thumbnail format. WebP falls
+# back to JPEG when Pillow has been built without WebP support
+_THUMBNAIL_FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 0}),
+    "jpeg": ("JPEG", {"quality": 85}),
+    "png": ("PNG", {}),
+}
+_WEBP_SUPPORTED = features.check("webp")
+
+# Thread pool shared by all the tiled requests and image processing tasks
+TILED_IO_WORKERS = int(os.getenv("TILED_IO_WORKERS", "32"))
+_IO_POOL = None
+_IO_POOL_PID = None
+_IO_POOL_LOCK = threading.Lock()
+
+
+def _get_io_pool():
+    """
+    Get the thread pool shared across calls. The pool is created on first use and recreated
+    in forked processes (e.g. long callbacks), which do not inherit the threads of the parent
+    Returns:
+        Thread pool executor
+    """
+    global _IO_POOL, _IO_POOL_PID
+    with _IO_POOL_LOCK:
+        if _IO_POOL is None or _IO_POOL_PID != os.getpid():
+            _IO_POOL = concurrent.futures.ThreadPoolExecutor(
+                max_workers=TILED_IO_WORKERS, thread_name_prefix="tiled-io"
+            )
+            _IO_POOL_PID = os.getpid()
+        return _IO_POOL
+
+
+@atexit.register
+def _shutdown_io_pool():
+    if _IO_POOL is not None and _IO_POOL_PID == os.getpid():
+        _IO_POOL.shutdown(wait=False)
+
+
+def _get_browse_cache():
+    """
+    Get the on-disk cache of the browsed tiled nodes, which is opened on first use
+    Returns:
+        Diskcache cache
+    """
+    global _BROWSE_CACHE
+    with _BROWSE_CACHE_LOCK:
+        if _BROWSE_CACHE is None:
+            if TILED_BROWSE_CACHE_DIR == _DEFAULT_BROWSE_CACHE_DIR:
+                # Refuse a default directory created by another user, whose pickles would be
+                # loaded by the cache
+                os.makedirs(TILED_BROWSE_CACHE_DIR, mode=0o700, exist_ok=True)
+                if (
+                    hasattr(os, "getuid")
+                    and os.stat(TILED_BROWSE_CACHE_DIR).st_uid != os.getuid()
+                ):
+                    raise PermissionError(
+                        f"{TILED_BROWSE_CACHE_DIR} is not owned by the current user"
+                    )
+            _BROWSE_CACHE = diskcache.Cache(TILED_BROWSE_CACHE_DIR)
+        return _BROWSE_CACHE
+
+
+@lru_cache(maxsize=16)
+def _get_client(tiled_uri, api_key, pid):
+    """
+    Get a tiled client, which is created once per URI and API key such that its connection pool
+    is reused across calls. The process ID is part of the key so that forked processes do not
+    share the connections of their parent
+    Args:
+        tiled_uri:          Tiled URI
+        api_key:            Tiled API key
+        pid:                ID of the current process
+    Returns:
+        Tiled client
+    """
+    return from_uri(tiled_uri, api_key=api_key)
+
+
+# Images that follow the last requested index of a stack are fetched in the background and kept
+# in a LRU cache, keyed by (array URI, index, downsample), for sequential browsing. The cache is
+# bounded by the total size of the cached images, in bytes, per process
+TILED_PREFETCH_DEPTH = int(os.getenv("TILED_PREFETCH_DEPTH", "4"))
+TILED_PREFETCH_CACHE_BYTES = int(
+    os.getenv("TILED_PREFETCH_CACHE_BYTES", str(256 << 20))
+)
+_PREFETCH_CACHE = collections.OrderedDict()
+_PREFETCH_CACHE_NBYTES = 0
+# Arrays with a prefetch in flight, keyed by (array URI, downsample)
+_PREFETCH_PENDING = set()
+_PREFETCH_LOCK = threading.Lock()
+_PREFETCH_PID = os.getpid()
+
+
+def _check_prefetch_pid():
+    """
+    Reset the prefetch state in forked processes (e.g. long callbacks), which do not inherit
+    the prefetch threads of the parent and could inherit its lock in a locked state
+    """
+    global _PREFETCH_LOCK, _PREFETCH_CACHE_NBYTES, _PREFETCH_PID
+    if _PREFETCH_PID != os.getpid():
+        _PREFETCH_LOCK = threading.Lock()
+        _PREFETCH_CACHE.clear()
+        _PREFETCH_CACHE_NBYTES = 0
+        _PREFETCH_PENDING.clear()
+        _PREFETCH_PID = os.getpid()
+
 
 class TiledDataset(Dataset):
     def __init__(
@@ -30,6 +168,10 @@ class TiledDataset(Dataset):
         Definition of a tiled data set
         """
         super().__init__(uri, cumulative_data_count)
+        self._node = None
+        self._node_client = None
+        self._base_array_uri = None
+        self._is_stack = None
         pass
 
     def to_dict(self):
@@ -67,11 +209,11 @@ class TiledDataset(Dataset):
         Returns:
             Tiled client
         """
-        # Checks if a static tiled client has been set, otherwise creates a new one
+        # Checks if a static tiled client has been set, otherwise reuses or creates one
         if static_tiled_client:
             return static_tiled_client
         else:
-            client = from_uri(tiled_uri, api_key=api_key)
+            client = _get_client(tiled_uri, api_key, os.getpid())
             return client
 
     @classmethod
@@ -97,33 +239,158 @@ class TiledDataset(Dataset):
         x = cls._normalize_percentiles(x)
         return x
 
-    @staticmethod
-    def _normalize_percentiles(x, low_perc=0.01, high_perc=99):
-        low = np.percentile(x.ravel(), low_perc)
-        high = np.percentile(x.ravel(), high_perc)
+    @classmethod
+    def _normalize_percentiles(cls, x, low_perc=0.01, high_perc=99):
+        low, high = cls._percentiles(x, (low_perc, high_perc))
         x = (np.clip((x - low) / (high - low), 0, 1) * 255).astype(np.uint8)
         return x
 
-    def _process_image(self, image, log, resize, export):
+    @staticmethod
+    def _percentiles(x, percs):
+        """
+        Compute percentiles of an image. For 8 and 16 bit integer images, the percentiles are
+        looked up in the cumulative histogram of the image instead of sorting all its values,
+        with the same linear interpolation as np.percentile
+        Args:
+            x:          Image
+            percs:      Sequence of percentiles to compute
+        Returns:
+            Array of percentiles
+        """
+        if (
+            isinstance(x, np.ma.MaskedArray)
+            or x.dtype.kind not in "ui"
+            or x.itemsize > 2
+        ):
+            return np.percentile(x.ravel(), percs)
+        values = x.ravel()
+        offset = 0
+        if x.dtype.kind == "i":
+            offset = int(values.min())
+            values = values.astype(np.int32) - offset
+        cdf = np.cumsum(np.bincount(values))
+        # Position of each percentile within the sorted values
+        positions = np.asarray(percs, dtype=np.float64) / 100 * (values.size - 1)
+        lower = np.floor(positions)
+        lower_values = np.searchsorted(cdf, lower, side="right")
+        upper_values = np.searchsorted(
+            cdf, np.minimum(lower + 1, values.size - 1), side="right"
+        )
+        return (
+            offset + lower_values + (positions - lower) * (upper_values - lower_values)
+        )
+
+    @staticmethod
+    def _to_grayscale(block):
+        """
+        Convert a block of multi-channel images to grayscale with the ITU-R 601 luma weights
+        Args:
+            block:      Block of images with the RGB(A) channels in the last or second dimension
+        Returns:
+            Block of 2D images with the same data type, or the input block if it has no color
+            channels
+        """
+        if block.ndim != 4:
+            return block
+        if block.shape[-1] in (3, 4):
+            channels = np.moveaxis(block, -1, 0)
+        elif block.shape[1] in (3, 4):
+            channels = np.moveaxis(block, 1, 0)
+        else:
+            return block
+        gray = 0.299 * channels[0] + 0.587 * channels[1] + 0.114 * channels[2]
+        return gray.astype(block.dtype, copy=False)
+
+    @classmethod
+    def _process_block(cls, block, log, resize, grayscale=True, percs=(0.01, 99)):
+        """
+        Prepare a block of images for display. The grayscale conversion, decimation and
+        percentile normalization are applied to the whole block at once
+        Args:
+            block:      Block of images, with the images along the first dimension
+            log:        Apply log to the images
+            resize:     Decimate the images down to the thumbnail size
+            grayscale:  Convert color images to grayscale, defaults to True
+            percs:      Low and high percentiles used to normalize the images
+        Returns:
+            Block or list of uint8 images
+        """
+        if grayscale:
+            block = cls._to_grayscale(block)
+
+        if resize:
+            # Decimate down to the thumbnail size before the per-pixel operations
+            step = max(1, min(block.shape[1:3]) // _THUMBNAIL_SIZE[0])
+            block = block[:, ::step, ::step]
+        # Copy the block once if needed, such that the reshapes below are views
+        block = np.ascontiguousarray(block)
+
         if log:
-            image = self._log_image(image)
-        elif image.dtype != np.uint8:
-            image = self._normalize_percentiles(image)
+            return [cls._log_image(image) for image in block]
+        if block.dtype == np.uint8:
+            return block
+
+        low, high = cls._percentiles_per_image(block, percs)
+        # Broadcast the percentiles of each image over its pixels
+        low = low.reshape((-1,) + (1,) * (block.ndim - 1))
+        high = high.reshape(low.shape)
+        # Normalize in place on a single float32 intermediate array, which is precise enough
+        # for 8 bit thumbnails and halves the memory traffic of float64
+        normalized = np.subtract(block, low, dtype=np.float32)
+        normalized /= (high - low).astype(np.float32)
+        np.clip(normalized, 0, 1, out=normalized)
+        normalized *= 255
+        return normalized.astype(np.uint8)
+
+    @classmethod
+    def _percentiles_per_image(cls, block, percs):
+        """
+        Compute percentiles of each image in a block
+        Args:
+            block:      Block of images, with the images along the first dimension
+            percs:      Sequence of percentiles to compute
+        Returns:
+            Array of percentiles with shape (len(percs), number of images)
+        """
+        if block.dtype.kind in "ui" and block.itemsize <= 2:
+            return np.stack([cls._percentiles(image, percs) for image in block], axis=1)
+        return np.percentile(block.reshape(len(block), -1), percs, axis=1)
 
+    @staticmethod
+    def _encode_image(image, resize, export, thumbnail_format="webp"):
+        """
+        Encode an image for display
+        Args:
+            image:              uint8 image
+            resize:             Resize image to the thumbnail size
+            export:             Export format, "pillow" or base64
+            thumbnail_format:   Image format of the base64 export, "webp", "jpeg" or "png"
+        Returns:
+            Base64/PIL image
+        """
         image = Image.fromarray(image)
 
         if resize:
-            image = image.resize((200, 200))
+            # Area averaging is the anti-aliasing filter for downscaling, and the cheapest one
+            if image.width >= _THUMBNAIL_SIZE[0] and image.height >= _THUMBNAIL_SIZE[1]:
+                image = image.resize(_THUMBNAIL_SIZE, Image.BOX)
+            else:
+                image = image.resize(_THUMBNAIL_SIZE)
 
         if export == "pillow":
             return image
         else:
+            if thumbnail_format == "webp" and not _WEBP_SUPPORTED:
+                thumbnail_format = "jpeg"
+            pil_format, save_kwargs = _THUMBNAIL_FORMATS[thumbnail_format]
+            if pil_format == "JPEG" and image.mode not in ("L", "RGB"):
+                image = image.convert("RGB")
             buffered = io.BytesIO()
-            image.save(buffered, format="PNG")
+            image.save(buffered, format=pil_format, **save_kwargs)
             contents = buffered.getvalue()
 
         contents_base64 = base64.b64encode(contents).decode("utf-8")
-        return f"data:image/png;base64,{contents_base64}"
+        return f"data:image/{thumbnail_format};base64,{contents_base64}"
 
     def read_data(
         self,
@@ -136,6 +403,8 @@ class TiledDataset(Dataset):
         downsample=False,
         just_uri=False,
         tiled_client=None,
+        grayscale=True,
+        thumbnail_format="webp",
     ):
         """
         Read data set
@@ -148,6 +417,9 @@ class TiledDataset(Dataset):
             api_key:           Tiled API key
             downsample:        Downsample the image, defaults to False
             just_uri:          Return only the uri, defaults to False
+            tiled_client:      Tiled client, defaults to a new client for root_uri
+            grayscale:         Convert color images to grayscale, defaults to True
+            thumbnail_format:  Image format of the base64 export, defaults to webp
         Returns:
             Base64/PIL image
             Dataset URI
@@ -155,66 +427,266 @@ class TiledDataset(Dataset):
         if isinstance(indexes, int):
             indexes = [indexes]
 
-        if tiled_client is None:
+        # URI-only reads do not need a client once the base URI has been retrieved
+        if tiled_client is None and (not just_uri or self._base_array_uri is None):
             tiled_client = self.get_tiled_client(root_uri, api_key)
 
         tiled_uris = self._get_tiled_uris(tiled_client, indexes)
         if just_uri:
             return tiled_uris
 
-        tiled_data = tiled_client[self.uri]
-        if downsample:
-            if len(tiled_data.shape) == 4:
-                block_data = tiled_data[indexes, :, ::10, ::10]
-            elif len(tiled_data.shape) == 3:
-                block_data = tiled_data[indexes, ::10, ::10]
-            else:
-                block_data = tiled_data[::10, ::10]
-                block_data = np.expand_dims(block_data, axis=0)
+        tiled_data = self._node_for(tiled_client)
+        executor = _get_io_pool()
+        if len(tiled_data.shape) > 2:
+            # Bulk raw exports read each image once, prefetching them would only add requests
+            block_data = self._fetch_blocks_cached(
+                tiled_data, indexes, downsample, executor, prefetch=export != "raw"
+            )
         else:
-            if len(tiled_data.shape) == 4:
-                block_data = tiled_data[indexes]
-            elif len(tiled_data.shape) == 3:
-                block_data = tiled_data[indexes]
+            if downsample:
+                block_data = self._read_strided(tiled_data, (_DOWNSAMPLE, _DOWNSAMPLE))
             else:
                 block_data = tiled_data
-                block_data = np.expand_dims(block_data, axis=0)
+            block_data = np.expand_dims(block_data, axis=0)
 
         if export == "raw":
             return block_data, tiled_uris
 
         # Check if there are 4 dimensions for a grayscale image
         if block_data.shape[1] == 1:
-            block_data = np.squeeze(block_data, axis=1)
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            data = list(
-                executor.map(
-                    self._process_image,
-                    block_data,
-                    [log] * len(indexes),
-                    [resize] * len(indexes),
-                    [export] * len(indexes),
-                )
+            block_data = block_data[:, 0]
+
+        block_data = self._process_block(block_data, log, resize, grayscale=grayscale)
+        # Only the encoding runs per image, as PIL releases the GIL while compressing
+        data = list(
+            executor.map(
+                partial(
+                    self._encode_image,
+                    resize=resize,
+                    export=export,
+                    thumbnail_format=thumbnail_format,
+                ),
+                block_data,
             )
+        )
         return data, tiled_uris
 
-    def _get_tiled_uris(self, tiled_client, indexes):
+    @staticmethod
+    def _fetch_block(tiled_data, downsample, index):
+        """
+        Fetch the data at a given index from tiled
+        Args:
+            tiled_data:        Tiled array client with 3 or 4 dimensions
+            downsample:        Downsample the image, defaults to False
+            index:             Index or slice of indexes of the images to retrieve
+        Returns:
+            Block of data
+        """
+        if not downsample:
+            return tiled_data[index]
+        if len(tiled_data.shape) == 4:
+            return TiledDataset._read_strided(
+                tiled_data, (index, slice(None), _DOWNSAMPLE, _DOWNSAMPLE)
+            )
+        return TiledDataset._read_strided(tiled_data, (index, _DOWNSAMPLE, _DOWNSAMPLE))
+
+    @staticmethod
+    def _read_strided(tiled_data, slices):
+        """
+        Read a strided slice of a tiled array. The slice is applied by the tiled server, such that
+        only the requested elements are transferred instead of the full blocks that contain them
+        Args:
+            tiled_data:        Tiled array client
+            slices:            Tuple with an index or slice per dimension of the array
+        Returns:
+            Sliced data
+        """
+        structure = tiled_data.structure()
+        dtype = structure.data_type.to_numpy_dtype()
+        shape = tuple(
+            len(range(*dim.indices(size)))
+            for dim, size in zip(slices, structure.shape)
+            if isinstance(dim, slice)
+        )
+        slice_param = ",".join(
+            (
+                f"{dim.start or ''}:{dim.stop or ''}:{dim.step or ''}"
+                if isinstance(dim, slice)
+                else str(int(dim))
+            )
+            for dim in slices
+        )
+        content = handle_error(
+            tiled_data.context.http_client.get(
+                tiled_data.item["links"]["full"],
+                headers={"Accept": "application/octet-stream"},
+                params={"slice": slice_param},
+            )
+        ).read()
+        return np.frombuffer(content, dtype=dtype).reshape(shape)
+
+    @classmethod
+    def _fetch_blocks(cls, tiled_data, indexes, downsample, executor):
+        """
+        Fetch the data at the given indexes from tiled. Contiguous indexes are retrieved in a
+        single request, while non-contiguous indexes are retrieved concurrently with one request
+        per index to avoid transferring the data in between
+        Args:
+            tiled_data:        Tiled array client with 3 or 4 dimensions
+            indexes:           List of indexes of the images to retrieve
+            downsample:        Downsample the image, defaults to False
+            executor:          Executor used to run the requests concurrently
+        Returns:
+            Block of data stacked in the order of the indexes
+        """
+        start = indexes[0]
+        if list(indexes) == list(range(start, start + len(indexes))):
+            return cls._fetch_block(
+                tiled_data, downsample, slice(start, start + len(indexes))
+            )
+        fetch_block = partial(cls._fetch_block, tiled_data, downsample)
+        return np.stack(list(executor.map(fetch_block, indexes)))
+
+    @classmethod
+    def _fetch_blocks_cached(
+        cls, tiled_data, indexes, downsample, executor, prefetch=True
+    ):
+        """
+        Fetch the data at the given indexes, reusing the prefetched images. The images that
+        follow the last index are then prefetched in the background
+        Args:
+            tiled_data:        Tiled array client with 3 or 4 dimensions
+            indexes:           List of indexes of the images to retrieve
+            downsample:        Downsample the image, defaults to False
+            executor:          Executor used to run the requests concurrently
+            prefetch:          Prefetch the images that follow the last index, defaults to True
+        Returns:
+            Block of data stacked in the order of the indexes
+        """
+        _check_prefetch_pid()
+        array_uri = tiled_data.uri
+        with _PREFETCH_LOCK:
+            images = {}
+            for index in indexes:
+                key = (array_uri, index, downsample)
+                if key in _PREFETCH_CACHE:
+                    _PREFETCH_CACHE.move_to_end(key)
+                    images[index] = _PREFETCH_CACHE[key]
+        missing_indexes = [index for index in indexes if index not in images]
+        if missing_indexes:
+            block_data = cls._fetch_blocks(
+                tiled_data, missing_indexes, downsample, executor
+            )
+            images.update(zip(missing_indexes, block_data))
+        if prefetch:
+            cls._schedule_prefetch(tiled_data, max(indexes) + 1, downsample, executor)
+        return np.stack([images[index] for index in indexes])
+
+    @classmethod
+    def _schedule_prefetch(cls, tiled_data, start, downsample, executor):
+        """
+        Submit the prefetch of the images that follow a given index, unless they are already
+        cached or a prefetch of the same array is in flight. No more images are prefetched than
+        fit in the byte budget of the cache
+        Args:
+            tiled_data:        Tiled array client with 3 or 4 dimensions
+            start:             First index to prefetch
+            downsample:        Downsample the image
+            executor:          Executor used to run the prefetch
+        """
+        _check_prefetch_pid()
+        array_uri = tiled_data.uri
+        image_shape = list(tiled_data.shape[1:])
+        if downsample:
+            image_shape[-2:] = [
+                len(range(*_DOWNSAMPLE.indices(n))) for n in image_shape[-2:]
+            ]
+        image_nbytes = int(np.prod(image_shape)) * tiled_data.dtype.itemsize
+        depth = min(
+            TILED_PREFETCH_DEPTH, TILED_PREFETCH_CACHE_BYTES // max(image_nbytes, 1)
+        )
+        stop = min(start + depth, tiled_data.shape[0])
+        with _PREFETCH_LOCK:
+            indexes = [
+                index
+                for index in range(start, stop)
+                if (array_uri, index, downsample) not in _PREFETCH_CACHE
+            ]
+            if not indexes or (array_uri, downsample) in _PREFETCH_PENDING:
+                return
+            _PREFETCH_PENDING.add((array_uri, downsample))
+        executor.submit(cls._prefetch, tiled_data, indexes, downsample)
+
+    @classmethod
+    def _prefetch(cls, tiled_data, indexes, downsample):
+        """
+        Fetch a range of images in a single request and store them in the prefetch cache. The
+        request is run in the calling thread, such that it never waits on other pool tasks
+        Args:
+            tiled_data:        Tiled array client with 3 or 4 dimensions
+            indexes:           Sorted list of indexes of the images to prefetch
+            downsample:        Downsample the image
+        """
+        global _PREFETCH_CACHE_NBYTES
+        array_uri = tiled_data.uri
+        try:
+            block_data = cls._fetch_block(
+                tiled_data, downsample, slice(indexes[0], indexes[-1] + 1)
+            )
+            with _PREFETCH_LOCK:
+                for index, image in enumerate(block_data, start=indexes[0]):
+                    key = (array_uri, index, downsample)
+                    if key in _PREFETCH_CACHE:
+                        _PREFETCH_CACHE_NBYTES -= _PREFETCH_CACHE.pop(key).nbytes
+                    # Copy each image, such that evicting it releases its memory
+                    _PREFETCH_CACHE[key] = np.array(image)
+                    _PREFETCH_CACHE_NBYTES += image.nbytes
+                while (
+                    _PREFETCH_CACHE
+                    and _PREFETCH_CACHE_NBYTES > TILED_PREFETCH_CACHE_BYTES
+                ):
+                    _PREFETCH_CACHE_NBYTES -= _PREFETCH_CACHE.popitem(last=False)[
+                        1
+                    ].nbytes
+        finally:
+            with _PREFETCH_LOCK:
+                _PREFETCH_PENDING.discard((array_uri, downsample))
+
+    def _node_for(self, tiled_client):
         """
-        Get tiled URIs
+        Get the tiled node of the data set, which is retrieved once per tiled client
         Args:
             tiled_client:      Tiled client
+        Returns:
+            Tiled node
+        """
+        if self._node is None or self._node_client is not tiled_client:
+            self._node = tiled_client[self.uri]
+            self._node_client = tiled_client
+        return self._node
+
+    def _get_tiled_uris(self, tiled_client, indexes):
+        """
+        Get tiled URIs. The base URI of the data set is retrieved once per instance
+        Args:
+            tiled_client:      Tiled client, only used on the first call
             indexes:           List of indexes of the images to retrieve
         Returns:
             List of tiled URIs
         """
-        tiled_metadata = tiled_client[self.uri]
-        base_tiled_uri = tiled_metadata.uri
-        if len(tiled_metadata.shape) > 2 and tiled_metadata.shape[0] > 1:
-            base_tiled_uri.replace("/metadata/", "/array/full/")
-            return [f"{base_tiled_uri}?slice={index}" for index in indexes]
+        if self._base_array_uri is None:
+            tiled_metadata = self._node_for(tiled_client)
+            base_tiled_uri = tiled_metadata.uri
+            self._is_stack = (
+                len(tiled_metadata.shape) > 2 and tiled_metadata.shape[0] > 1
+            )
+            if self._is_stack:
+                base_tiled_uri = base_tiled_uri.replace("/metadata/", "/array/full/")
+            self._base_array_uri = base_tiled_uri
+        if self._is_stack:
+            return [f"{self._base_array_uri}?slice={index}" for index in indexes]
         else:
-            return [base_tiled_uri]
+            return [self._base_array_uri]
 
     def get_uri_index(self, uri):
         """
@@ -245,8 +717,7 @@ class TiledDataset(Dataset):
             return None
 
     @staticmethod
-    def _get_node_size(tiled_client, node):
-        tiled_array = tiled_client[node]
+    def _get_node_size(tiled_array):
         array_shape = tiled_array.shape
         if len(array_shape) == 2:
             return 1
@@ -254,21 +725,17 @@ class TiledDataset(Dataset):
             return array_shape[0]
 
     @classmethod
-    def _get_cumulative_data_count(cls, tiled_client, nodes):
+    def _get_cumulative_data_count(cls, tiled_arrays):
         """
-        Retrieve tiled data sets from list of tiled_uris
+        Retrieve the cumulative data count of a list of tiled arrays
         Args:
-            tiled_uris:         Tiled URIs from which data should be retrieved
-            api_key:            Tiled API key
+            tiled_arrays:       Tiled array clients, which already hold their structure
         Returns:
-            Length of the data set
+            Cumulative length of the data sets
         """
-        get_node_size_with_client = partial(cls._get_node_size, tiled_client)
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            sizes = list(executor.map(get_node_size_with_client, nodes))
+        sizes = [cls._get_node_size(tiled_array) for tiled_array in tiled_arrays]
 
-        cumulative_dataset_size = [sum(sizes[: i + 1]) for i in range(len(sizes))]
+        cumulative_dataset_size = list(itertools.accumulate(sizes))
         return cumulative_dataset_size
 
     @classmethod
@@ -290,38 +757,86 @@ class TiledDataset(Dataset):
             tiled_uris:              List of tiled URIs found in tiled client
             cumulative_data_counts:  Cumulative data count
         """
+        if selected_sub_uris == [""]:
+            # Browse the tiled URI
+            return cls._browse_nodes_cached(root_uri, api_key, sub_uri_template)
+
         tiled_client = cls.get_tiled_client(root_uri, api_key)
-        if selected_sub_uris != [""]:
-            # Check if the selected sub URIs are nodes
-            tmp_sub_uris = []
-            for sub_uri in selected_sub_uris:
-                if type(tiled_client[sub_uri]) is ArrayClient:
-                    tmp_sub_uris.append(sub_uri)
-                else:
-                    tmp_sub_uris += [
-                        f"{sub_uri}/{node}" for node in tiled_client[sub_uri]
-                    ]
-            selected_sub_uris = tmp_sub_uris
-
-            # Get sizes of the selected nodes
-            cumulative_data_counts = cls._get_cumulative_data_count(
-                tiled_client,
-                selected_sub_uris,
-            )
-            return selected_sub_uris, cumulative_data_counts
+        # Check if the selected sub URIs are nodes. The children of a container are listed
+        # together with their structure, such that their sizes need no further requests
+        tmp_sub_uris = []
+        tiled_arrays = []
+        for sub_uri in selected_sub_uris:
+            tiled_node = tiled_client[sub_uri]
+            if type(tiled_node) is ArrayClient:
+                tmp_sub_uris.append(sub_uri)
+                tiled_arrays.append(tiled_node)
+            else:
+                for node, tiled_array in tiled_node.items():
+                    tmp_sub_uris.append(f"{sub_uri}/{node}")
+                    tiled_arrays.append(tiled_array)
+        selected_sub_uris = tmp_sub_uris
 
-        # Browse the tiled URI
-        tiled_uris = []
+        # Get sizes of the selected nodes
+        cumulative_data_counts = cls._get_cumulative_data_count(tiled_arrays)
+        return selected_sub_uris, cumulative_data_counts
+
+    @classmethod
+    def _browse_nodes_cached(cls, root_uri, api_key, sub_uri_template):
+        """
+        Retrieve the list of nodes from tiled URI, reusing the results of recent browses
+        Args:
+            root_uri:                Root URI from which data should be retrieved
+            api_key:                 Tiled API key
+            sub_uri_template:        Template for the sub URI
+        Returns:
+            tiled_uris:              List of tiled URIs found in tiled client
+            cumulative_data_counts:  Cumulative data count
+        """
+        # The API key is hashed to avoid storing it in the cache directory
+        hashed_api_key = hashlib.sha256(str(api_key).encode("utf-8")).hexdigest()
+        key = ("browse", root_uri, hashed_api_key, sub_uri_template)
+        # The cache is an optimization, any cache error falls back to an uncached browse
+        try:
+            browse_cache = _get_browse_cache()
+            browse_results = browse_cache.get(key)
+        except Exception:
+            browse_cache = browse_results = None
+        if browse_results is None:
+            tiled_client = cls.get_tiled_client(root_uri, api_key)
+            browse_results = cls._browse_nodes(tiled_client, sub_uri_template)
+            if browse_cache is not None:
+                try:
+                    browse_cache.set(key, browse_results, expire=TILED_BROWSE_CACHE_TTL)
+                except Exception:
+                    pass
+        return browse_results
+
+    @classmethod
+    def _browse_nodes(cls, tiled_client, sub_uri_template):
+        """
+        Retrieve the list of nodes that contain the sub URI template
+        Args:
+            tiled_client:            Tiled client
+            sub_uri_template:        Template for the sub URI
+        Returns:
+            tiled_uris:              List of tiled URIs found in tiled client
+            cumulative_data_counts:  Cumulative data count
+        """
         nodes = list(tiled_client)
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_to_node = {
-                executor.submit(
-                    cls._check_node, tiled_client, sub_uri_template, node
-                ): node
-                for node in nodes
-            }
-            for future in concurrent.futures.as_completed(future_to_node):
-                uri = future.result()
-                if uri is not None:
-                    tiled_uris.append(uri)
+        if not sub_uri_template:
+            # Every listed node matches an empty template, no need to probe them
+            tiled_uris = [f"/{node}/" for node in nodes]
+            return tiled_uris, [0] * len(tiled_uris)
+
+        tiled_uris = []
+        executor = _get_io_pool()
+        future_to_node = {
+            executor.submit(cls._check_node, tiled_client, sub_uri_template, node): node
+            for node in nodes
+        }
+        for future in concurrent.futures.as_completed(future_to_node):
+            uri = future.result()
+            if uri is not None:
+                tiled_uris.append(uri)
         return tiled_uris, [0] * len(tiled_uris)
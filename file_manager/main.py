@@ -14,9 +14,22 @@ from dash.exceptions import PreventUpdate
 
 from file_manager.dash_file_explorer import create_file_explorer
 from file_manager.data_project import DataProject
+from file_manager.dataset.tiled_dataset import TILED_BROWSE_CACHE_TTL
 
 DATA_DIR = os.getenv("DATA_DIR", ".")
 
+# Row selection is toggled in the browser to avoid sending the table data to the server
+_SELECT_ALL_JS = """
+function(n_clicks, table_data) {
+    return table_data ? table_data.map((row, index) => index) : [];
+}
+"""
+_UNSELECT_ALL_JS = """
+function(n_clicks) {
+    return [];
+}
+"""
+
 
 class FileManager:
     def __init__(
@@ -173,6 +186,26 @@ class FileManager:
         )(self._load_file_table)
         pass
 
+        # Skip the server round trip when browsing the same tiled URI that was last browsed,
+        # until the browse results expire
+        app.clientside_callback(
+            """
+            function(n_clicks, tiled_uri, tiled_sub_uri, browsed_uri) {
+                if (browsed_uri && browsed_uri.uri === tiled_uri && browsed_uri.sub_uri === tiled_sub_uri
+                        && Date.now() < browsed_uri.expires) {
+                    return window.dash_clientside.no_update;
+                }
+                return {uri: tiled_uri, sub_uri: tiled_sub_uri, time: Date.now()};
+            }
+            """,
+            Output({"base_id": "file-manager", "name": "tiled-browse-request"}, "data"),
+            Input({"base_id": "file-manager", "name": "tiled-browse"}, "n_clicks"),
+            State({"base_id": "file-manager", "name": "tiled-uri"}, "value"),
+            State({"base_id": "file-manager", "name": "tiled-sub-uri"}, "value"),
+            State({"base_id": "file-manager", "name": "tiled-browsed-uri"}, "data"),
+            prevent_initial_call=True,
+        )
+
         app.long_callback(
             Output({"base_id": "file-manager", "name": "tiled-table"}, "data"),
             Output(
@@ -180,16 +213,18 @@ class FileManager:
                 "is_open",
                 allow_duplicate=True,
             ),
+            Output({"base_id": "file-manager", "name": "tiled-browsed-uri"}, "data"),
             [
-                Input({"base_id": "file-manager", "name": "tiled-browse"}, "n_clicks"),
-                State({"base_id": "file-manager", "name": "tiled-uri"}, "value"),
-                State({"base_id": "file-manager", "name": "tiled-sub-uri"}, "value"),
+                Input(
+                    {"base_id": "file-manager", "name": "tiled-browse-request"}, "data"
+                ),
             ],
             prevent_initial_call=True,
         )(self._load_tiled_table)
         pass
 
-        app.callback(
+        app.clientside_callback(
+            _SELECT_ALL_JS,
             Output({"base_id": "file-manager", "name": "files-table"}, "selected_rows"),
             [
                 Input(
@@ -198,10 +233,10 @@ class FileManager:
                 State({"base_id": "file-manager", "name": "files-table"}, "data"),
             ],
             prevent_initial_call=True,
-        )(self._select_all)
-        pass
+        )
 
-        app.callback(
+        app.clientside_callback(
+            _UNSELECT_ALL_JS,
             Output(
                 {"base_id": "file-manager", "name": "files-table"},
                 "selected_rows",
@@ -214,10 +249,10 @@ class FileManager:
                 ),
             ],
             prevent_initial_call=True,
-        )(self._unselect_all)
-        pass
+        )
 
-        app.callback(
+        app.clientside_callback(
+            _SELECT_ALL_JS,
             Output({"base_id": "file-manager", "name": "tiled-table"}, "selected_rows"),
             [
                 Input(
@@ -226,10 +261,10 @@ class FileManager:
                 State({"base_id": "file-manager", "name": "tiled-table"}, "data"),
             ],
             prevent_initial_call=True,
-        )(self._select_all)
-        pass
+        )
 
-        app.callback(
+        app.clientside_callback(
+            _UNSELECT_ALL_JS,
             Output(
                 {"base_id": "file-manager", "name": "tiled-table"},
                 "selected_rows",
@@ -242,8 +277,7 @@ class FileManager:
                 ),
             ],
             prevent_initial_call=True,
-        )(self._unselect_all)
-        pass
+        )
 
         app.long_callback(
             [
@@ -265,14 +299,14 @@ class FileManager:
                     {"base_id": "file-manager", "name": "confirm-update-data"}, "data"
                 ),
                 State(
-                    {"base_id": "file-manager", "name": "files-table"}, "selected_rows"
+                    {"base_id": "file-manager", "name": "files-table"},
+                    "derived_virtual_selected_row_ids",
                 ),
                 State(
-                    {"base_id": "file-manager", "name": "tiled-table"}, "selected_rows"
+                    {"base_id": "file-manager", "name": "tiled-table"},
+                    "derived_virtual_selected_row_ids",
                 ),
                 State({"base_id": "file-manager", "name": "tiled-uri"}, "value"),
-                State({"base_id": "file-manager", "name": "files-table"}, "data"),
-                State({"base_id": "file-manager", "name": "tiled-table"}, "data"),
                 State({"base_id": "file-manager", "name": "import-format"}, "value"),
             ],
         )(self._load_dataset)
@@ -343,19 +377,23 @@ class FileManager:
         browse_data = data_project.browse_data(
             browse_format,
         )
-        return [{"uri": dataset.uri} for dataset in browse_data]
+        return [{"uri": dataset.uri, "id": dataset.uri} for dataset in browse_data]
 
-    def _load_tiled_table(self, browse_n_clicks, tiled_uri, tiled_sub_uri):
+    def _load_tiled_table(self, browse_request):
         """
         This callback updates the content of the tiled table
         Args:
-            browse_n_clicks:        Number of clicks on browse Tiled button
-            tiled_uri:              Tiled URI for data access
-            tiled_sub_uri:          Tiled sub_uri query for data access
+            browse_request:         Tiled URI, sub_uri query and time in ms of the browse request
         Returns:
             table_data:             Updated table data according to browsing selection
             tiled_warning_modal:    Open warning indicating that the connection to tiled failed
+            browsed_uri:            Tiled URI and sub_uri query that were successfully browsed,
+                                    with the time in ms at which the browse results expire
         """
+        if browse_request is None:
+            raise PreventUpdate
+        tiled_uri = browse_request["uri"]
+        tiled_sub_uri = browse_request["sub_uri"]
         data_project = DataProject(
             data_type="tiled", root_uri=tiled_uri, api_key=self.api_key
         )
@@ -367,33 +405,13 @@ class FileManager:
             uri_list.sort()
         except Exception:
             self.logger.error(f"Connection to tiled failed: {traceback.format_exc()}")
-            return dash.no_update, True
-        return [{"uri": uri} for uri in uri_list], False
-
-    def _select_all(self, select_all_n_clicks, table_data):
-        """
-        This callback selects all rows in the table
-        Args:
-            select_all_n_clicks:    Number of clicks on select all button
-            table_data:             Current values within the table
-        Returns:
-            selected_rows:          List of selected rows
-        """
-        if select_all_n_clicks:
-            return list(range(len(table_data)))
-        return []
-
-    def _unselect_all(self, unselect_all_n_clicks):
-        """
-        This callback unselects all rows in the table
-        Args:
-            select_all_n_clicks:    Number of clicks on select all button
-        Returns:
-            selected_rows:          List of selected rows
-        """
-        if unselect_all_n_clicks:
-            return []
-        raise PreventUpdate
+            return dash.no_update, True, dash.no_update
+        browsed_uri = {
+            "uri": tiled_uri,
+            "sub_uri": tiled_sub_uri,
+            "expires": browse_request["time"] + TILED_BROWSE_CACHE_TTL * 1000,
+        }
+        return [{"uri": uri, "id": uri} for uri in uri_list], False, browsed_uri
 
     def _load_dataset(
         self,
@@ -405,8 +423,6 @@ class FileManager:
         file_rows,
         tiled_rows,
         tiled_uri,
-        files_table,
-        tiled_table,
         import_format,
     ):
         """
@@ -419,11 +435,9 @@ class FileManager:
             clear_data_n_clicks:    Number of clicks on clear data button
             tab_value:              Tab indicating data access method (filesystem/tiled)
             update_data:            Flag that indicates if the dataset can be updated
-            file_rows:              Selected rows in table of files/directories
-            tiled_rows:             Selected rows in table of tiled data
+            file_rows:              URIs of the selected rows in table of files/directories
+            tiled_rows:             URIs of the selected rows in table of tiled data
             tiled_uri:              Tiled URI for data access
-            files_table:            Current values within the table of files/directories/nodes
-            tiled_table:            Current values within the table of tiled data
             import_format:          File extension to import
         Returns:
             data_project_dict:      Dictionary containing the data project
@@ -466,22 +480,16 @@ class FileManager:
             )
 
         if tab_value != "tiled" and bool(file_rows):
-            selected_rows = []
-            for row in file_rows:
-                selected_rows.append(files_table[row]["uri"])
             data_project.datasets = data_project.browse_data(
                 import_format,
-                selected_sub_uris=selected_rows,
+                selected_sub_uris=list(file_rows),
             )
 
         elif bool(tiled_rows):
-            selected_rows = []
-            for row in tiled_rows:
-                selected_rows.append(tiled_table[row]["uri"])
             try:
                 data_project.datasets = data_project.browse_data(
                     "",
-                    selected_sub_uris=selected_rows,
+                    selected_sub_uris=list(tiled_rows),
                 )
             except Exception:
                 self.logger.error(
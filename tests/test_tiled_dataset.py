@@ -0,0 +1,163 @@
+import numpy as np
+import pytest
+
+from file_manager.dataset import tiled_dataset
+from file_manager.dataset.tiled_dataset import TiledDataset
+
+TILED_ROOT = "http://tiled:8000/api/v1"
+
+
+class StubNode:
+    def __init__(self, uri, shape, data=None):
+        self.uri = uri
+        self.shape = shape
+        self.data = data
+        self.fetches = []
+
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+    def __getitem__(self, index):
+        self.fetches.append(index)
+        return self.data[index]
+
+
+class StubClient:
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.requests = []
+
+    def __getitem__(self, key):
+        self.requests.append(key)
+        return self.nodes[key]
+
+
+def test_stack_uris_point_to_array_endpoint():
+    client = StubClient(
+        {"/stack": StubNode(f"{TILED_ROOT}/metadata/stack", (5, 40, 60))}
+    )
+    dataset = TiledDataset("/stack", 5)
+    uris = dataset.read_data(TILED_ROOT, [0, 3], just_uri=True, tiled_client=client)
+    assert uris == [
+        f"{TILED_ROOT}/array/full/stack?slice=0",
+        f"{TILED_ROOT}/array/full/stack?slice=3",
+    ]
+
+
+def test_2d_array_uri_is_unchanged():
+    client = StubClient({"/image": StubNode(f"{TILED_ROOT}/metadata/image", (40, 60))})
+    dataset = TiledDataset("/image", 1)
+    uris = dataset.read_data(TILED_ROOT, [0], just_uri=True, tiled_client=client)
+    assert uris == [f"{TILED_ROOT}/metadata/image"]
+
+
+def test_uris_are_served_from_cached_base_uri():
+    client = StubClient(
+        {"/stack": StubNode(f"{TILED_ROOT}/metadata/stack", (5, 40, 60))}
+    )
+    dataset = TiledDataset("/stack", 5)
+    dataset.read_data(TILED_ROOT, [0], just_uri=True, tiled_client=client)
+    uris = dataset.read_data(TILED_ROOT, [2], just_uri=True, tiled_client=None)
+    assert uris == [f"{TILED_ROOT}/array/full/stack?slice=2"]
+    assert client.requests == ["/stack"]
+
+
+class StubExecutor:
+    """
+    Executor that runs the mapped tasks in the calling thread and queues the submitted ones
+    """
+
+    def __init__(self):
+        self.submitted = []
+
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+    def submit(self, fn, *args):
+        self.submitted.append((fn, args))
+
+    def run_submitted(self):
+        while self.submitted:
+            fn, args = self.submitted.pop(0)
+            fn(*args)
+
+
+@pytest.fixture
+def prefetch_cache(monkeypatch):
+    monkeypatch.setattr(tiled_dataset, "TILED_PREFETCH_DEPTH", 3)
+    monkeypatch.setattr(tiled_dataset, "TILED_PREFETCH_CACHE_BYTES", 1 << 20)
+    monkeypatch.setattr(tiled_dataset, "_PREFETCH_CACHE_NBYTES", 0)
+    tiled_dataset._PREFETCH_CACHE.clear()
+    tiled_dataset._PREFETCH_PENDING.clear()
+    yield tiled_dataset._PREFETCH_CACHE
+    tiled_dataset._PREFETCH_CACHE.clear()
+    tiled_dataset._PREFETCH_PENDING.clear()
+
+
+def make_stack():
+    data = np.arange(10 * 4 * 5, dtype=np.uint16).reshape(10, 4, 5)
+    return StubNode(f"{TILED_ROOT}/metadata/stack", data.shape, data)
+
+
+def test_following_images_are_prefetched(prefetch_cache):
+    node = make_stack()
+    executor = StubExecutor()
+    block = TiledDataset._fetch_blocks_cached(node, [2], False, executor)
+    np.testing.assert_array_equal(block, node.data[[2]])
+    executor.run_submitted()
+    assert sorted(index for _, index, _ in prefetch_cache) == [3, 4, 5]
+
+
+def test_prefetched_image_is_read_without_fetch(prefetch_cache):
+    node = make_stack()
+    executor = StubExecutor()
+    TiledDataset._fetch_blocks_cached(node, [2], False, executor)
+    executor.run_submitted()
+    node.fetches.clear()
+    block = TiledDataset._fetch_blocks_cached(node, [3], False, executor)
+    np.testing.assert_array_equal(block, node.data[[3]])
+    assert node.fetches == []
+
+
+def test_prefetch_cache_is_bounded_by_bytes(prefetch_cache, monkeypatch):
+    node = make_stack()
+    image_nbytes = node.data[0].nbytes
+    monkeypatch.setattr(
+        tiled_dataset, "TILED_PREFETCH_CACHE_BYTES", int(2.5 * image_nbytes)
+    )
+    executor = StubExecutor()
+    for index in (0, 4, 7):
+        TiledDataset._fetch_blocks_cached(node, [index], False, executor)
+        executor.run_submitted()
+        assert (
+            tiled_dataset._PREFETCH_CACHE_NBYTES
+            <= tiled_dataset.TILED_PREFETCH_CACHE_BYTES
+        )
+        assert tiled_dataset._PREFETCH_CACHE_NBYTES == sum(
+            image.nbytes for image in prefetch_cache.values()
+        )
+    assert sorted(index for _, index, _ in prefetch_cache) == [8, 9]
+
+
+def test_raw_export_does_not_prefetch(prefetch_cache):
+    node = make_stack()
+    client = StubClient({"/stack": node})
+    TiledDataset("/stack", 10).read_data(
+        TILED_ROOT, [2], export="raw", tiled_client=client
+    )
+    assert tiled_dataset._PREFETCH_PENDING == set()
+    assert len(prefetch_cache) == 0
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.int8, np.int16])
+@pytest.mark.parametrize("size", [1, 2, 7, 1000])
+@pytest.mark.parametrize("percs", [(0.01, 99), (0, 100), (50,)])
+def test_histogram_percentiles_match_numpy(dtype, size, percs):
+    info = np.iinfo(dtype)
+    rng = np.random.default_rng(size)
+    image = rng.integers(info.min, info.max, size, endpoint=True).astype(dtype)
+    np.testing.assert_allclose(
+        TiledDataset._percentiles(image, percs),
+        np.percentile(image.astype(np.float64), percs),
+    )